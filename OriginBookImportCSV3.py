@@ -4,10 +4,51 @@ import json
 import originpro as op
 import sys
 import re
+import csv
+import copy
 import warnings
+from collections import namedtuple
 
 warnings.filterwarnings('ignore')
 
+# 已解析配置的缓存: (路径, mtime_ns, 大小, 配置目录) -> config
+_CONFIG_CACHE = {}
+
+# 工作簿名称清理用的预编译正则
+_UNSAFE_CHARS = re.compile(r'[^\w\s\-]')
+_MULTI_UNDERSCORE = re.compile(r'_+')
+_LEADING_DIGIT = re.compile(r'^\d').match
+
+# 列单位的设置方式，按优先级排列
+UNIT_METHODS = ('SetUnits', 'comments', 'lname')
+
+# Origin工程/模板文件扩展名
+ORIGIN_PROJECT_EXTENSIONS = frozenset({'.opj', '.opju', '.ogg', '.ogw', '.otp', '.otpu'})
+
+# 路径的常用分解结果，同一路径只分解一次
+_PathInfo = namedtuple('_PathInfo', ['dirname', 'basename', 'stem', 'ext_lower'])
+
+# DataName之后允许出现、需要静默跳过的行标记
+SKIP_PREFIXES = ('SetupTitle', 'PrimitiveTest', 'TestParameter',
+                 'AnalysisSetup', 'Dimension1', 'Dimension2', '#')
+
+
+def _path_info(path):
+    """一次性分解路径，供后续各处复用；已分解的直接返回"""
+    if isinstance(path, _PathInfo):
+        return path
+    dirname, basename = os.path.split(path)
+    stem, ext = os.path.splitext(basename)
+    return _PathInfo(dirname, basename, stem, ext.lower())
+
+
+def _text_to_numeric(values):
+    """去掉所有空白（如科学计数法中的空格）后把整列转换为数值，无法转换的记为空值"""
+    if not pd.api.types.is_string_dtype(values):
+        values = values.astype(str)  # 如C解析器读成布尔类型的列
+    return pd.to_numeric(values.str.replace(r'\s+', '', regex=True), errors='coerce')
+
+
 class OriginDataProcessor:
     """通用Origin数据处理与绘图类"""
 
@@ -18,17 +59,21 @@ class OriginDataProcessor:
         self.project_opened = False
         self.column_units = {}  # 存储列名到单位的映射
         self.column_order_from_dataname = []  # DataName行定义的列顺序
+        self._unit_method = None  # 列单位设置方式: SetUnits/comments/lname
+        self._delim_cache = {}  # 文件扩展名 -> 上次检测到的分隔符
+        # 是否输出数据预览和数值统计：默认仅在交互终端中输出，可由配置项verbose覆盖
+        self.verbose = sys.stdout is not None and sys.stdout.isatty()
+        self._exported_columns = []  # 最近一次导入工作表的列名
 
     def get_safe_filename(self, filename, max_length=30):
         """获取安全的工作簿名称"""
-        base_name = os.path.splitext(filename)[0]
-        safe_name = re.sub(r'[^\w\s\-]', '_', base_name)
-        safe_name = re.sub(r'_+', '_', safe_name)
+        base_name = _path_info(filename).stem
+        safe_name = _MULTI_UNDERSCORE.sub('_', _UNSAFE_CHARS.sub('_', base_name))
 
         if len(safe_name) > max_length:
             safe_name = safe_name[:max_length]
 
-        if safe_name and safe_name[0].isdigit():
+        if _LEADING_DIGIT(safe_name):
             safe_name = 'Data_' + safe_name
 
         if not safe_name or safe_name.isspace():
@@ -41,87 +86,114 @@ class OriginDataProcessor:
         if not file_path:
             return False
 
-        valid_extensions = ['.opj', '.opju', '.ogg', '.ogw', '.otp', '.otpu']
-        ext = os.path.splitext(file_path)[1].lower()
-        return ext in valid_extensions
+        return _path_info(file_path).ext_lower in ORIGIN_PROJECT_EXTENSIONS
 
     def find_origin_project(self, project_path):
         """智能查找Origin工程文件"""
         if not project_path:
             return None, False
 
-        if os.path.exists(project_path):
+        # 只读取一次目录，之后的查找（包括给定路径本身）都在内存中完成
+        project_info = _path_info(project_path)
+        dir_path = project_info.dirname or '.'
+        try:
+            with os.scandir(dir_path) as it:
+                entries = {os.path.normcase(entry.name): entry.name for entry in it}
+        except OSError:
+            entries = {}
+
+        if os.path.normcase(project_info.basename) in entries:
             return project_path, True
 
-        base_name = os.path.splitext(project_path)[0]
+        base_name = os.path.join(project_info.dirname, project_info.stem)
+        target_stem = project_info.stem
         possible_extensions = ['.opju', '.opj', '.ogg', '.ogw']
 
         for ext in possible_extensions:
-            test_path = base_name + ext
-            if os.path.exists(test_path):
+            if os.path.normcase(target_stem + ext) in entries:
+                test_path = base_name + ext
                 print(f"🔍 找到工程文件: {test_path}")
                 return test_path, True
 
-        dir_path = os.path.dirname(project_path) or '.'
-        if os.path.exists(dir_path):
-            for file in os.listdir(dir_path):
-                file_base = os.path.splitext(file)[0]
-                if file_base == os.path.basename(base_name):
-                    full_path = os.path.join(dir_path, file)
-                    if self.is_origin_project_file(full_path):
-                        print(f"🔍 找到匹配的工程文件: {full_path}")
-                        return full_path, True
+        for file in entries.values():
+            file_base, ext = os.path.splitext(file)
+            if file_base == target_stem and ext.lower() in ORIGIN_PROJECT_EXTENSIONS:
+                full_path = os.path.join(dir_path, file)
+                print(f"🔍 找到匹配的工程文件: {full_path}")
+                return full_path, True
 
         return project_path, False
 
-    def load_config(self, config_path):
-        """加载绘图配置文件"""
-        if not os.path.exists(config_path):
-            print(f"❌ 配置文件 '{config_path}' 不存在")
-            return None
+    def _parse_config(self, config_path):
+        """读取并解析配置文件内容"""
+        with open(config_path, 'r', encoding='utf-8') as f:
+            content = f.read().strip()
 
-        try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
+        config = {}
 
-            config = {}
+        if content.startswith('{'):
+            config = json.loads(content)
+        else:
+            for pair in content.split(','):
+                if ':' in pair:
+                    key, value = pair.split(':', 1)
+                    key = key.strip()
+                    value = value.strip()
+
+                    if key == 'NeedCol' and '|' in value:
+                        config[key] = [col.strip() for col in value.split('|')]
+                    else:
+                        config[key] = value
 
-            if content.startswith('{'):
-                config = json.loads(content)
-            else:
-                for pair in content.split(','):
-                    if ':' in pair:
-                        key, value = pair.split(':', 1)
-                        key = key.strip()
-                        value = value.strip()
+        required_keys = ['data_file', 'X', 'Y']
+        missing_keys = [key for key in required_keys if key not in config]
 
-                        if key == 'NeedCol' and '|' in value:
-                            config[key] = [col.strip() for col in value.split('|')]
-                        else:
-                            config[key] = value
+        if missing_keys:
+            print(f"❌ 配置文件中缺少必需字段: {missing_keys}")
+            print(f"必需字段: {required_keys}")
+            return None
 
-            required_keys = ['data_file', 'X', 'Y']
-            missing_keys = [key for key in required_keys if key not in config]
+        if 'project' not in config:
+            config['project'] = None
 
-            if missing_keys:
-                print(f"❌ 配置文件中缺少必需字段: {missing_keys}")
-                print(f"必需字段: {required_keys}")
-                return None
+        if 'output_dir' not in config:
+            data_dir = os.path.dirname(os.path.abspath(config['data_file']))
+            config['output_dir'] = data_dir
 
-            if 'project' not in config:
-                config['project'] = None
+        if 'NeedCol' in config:
+            if isinstance(config['NeedCol'], str):
+                config['NeedCol'] = [col.strip() for col in config['NeedCol'].split(',')]
+            elif not isinstance(config['NeedCol'], list):
+                print(f"⚠️  NeedCol格式错误，将提取全部列")
+                del config['NeedCol']
 
-            if 'output_dir' not in config:
-                data_dir = os.path.dirname(os.path.abspath(config['data_file']))
-                config['output_dir'] = data_dir
+        if isinstance(config.get('verbose'), str):
+            config['verbose'] = config['verbose'].strip().lower() in ('1', 'true', 'yes')
 
-            if 'NeedCol' in config:
-                if isinstance(config['NeedCol'], str):
-                    config['NeedCol'] = [col.strip() for col in config['NeedCol'].split(',')]
-                elif not isinstance(config['NeedCol'], list):
-                    print(f"⚠️  NeedCol格式错误，将提取全部列")
-                    del config['NeedCol']
+        return config
 
+    def load_config(self, config_path):
+        """加载绘图配置文件"""
+        if not os.path.exists(config_path):
+            print(f"❌ 配置文件 '{config_path}' 不存在")
+            return None
+
+        try:
+            # 同一配置文件未修改时直接复用上次的解析结果
+            st = os.stat(config_path)
+            cache_key = (os.path.abspath(config_path), st.st_mtime_ns, st.st_size,
+                         getattr(self, '_config_dir', None) or os.getcwd())
+
+            if cache_key in _CONFIG_CACHE:
+                config = copy.deepcopy(_CONFIG_CACHE[cache_key])
+            else:
+                config = self._parse_config(config_path)
+                if config is None:
+                    return None
+                config = self._resolve_paths(config)
+                _CONFIG_CACHE[cache_key] = copy.deepcopy(config)
+
+            # 工程文件是否存在会随运行而变化，每次都重新查找
             if config['project']:
                 actual_project_path, project_exists = self.find_origin_project(config['project'])
                 config['project'] = actual_project_path
@@ -129,7 +201,10 @@ class OriginDataProcessor:
             else:
                 config['project_exists'] = False
 
-            config = self._resolve_paths(config)
+            self._ensure_output_dir(config)
+
+            if 'verbose' in config:
+                self.verbose = bool(config['verbose'])
 
             print(f"✅ 成功加载配置：")
             print(f"   数据文件: {config['data_file']}")
@@ -172,91 +247,108 @@ class OriginDataProcessor:
             if not os.path.isabs(output_path):
                 output_path = os.path.join(config_dir, output_path)
             config['output_dir'] = os.path.abspath(output_path)
-            os.makedirs(config['output_dir'], exist_ok=True)
 
         return config
 
+    def _ensure_output_dir(self, config):
+        """确保输出目录存在"""
+        if 'output_dir' in config:
+            os.makedirs(config['output_dir'], exist_ok=True)
+
     def read_data_file(self, file_path, need_columns=None):
         """
         读取数据文件，处理复杂的双列名定义格式
         """
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        except Exception as e:
-            print(f"❌ 读取文件时发生错误：{e}")
-            return None, None, False
-
-        print(f"📂 开始解析文件: {os.path.basename(file_path)}")
-        print(f"   文件总行数: {len(lines)}")
+        file_info = _path_info(file_path)
+        print(f"📂 开始解析文件: {file_info.basename}")
 
         self.column_units.clear()
         self.column_order_from_dataname.clear()
 
-        # 1. 首先找到AnalysisSetup...Datum.Name行提取单位映射
         datum_name_headers = []
         unit_mapping = {}
+        found_datum_name = False
+        found_datum_unit = False
+        unit_search_end = -1  # Datum.Name行之后查找Datum.Unit行的范围
+        unit_delimiter = ','
 
-        for i, line in enumerate(lines):
-            line = line.strip()
-
-            if line.startswith('AnalysisSetup') and 'Datum.Name' in line:
-                print(f"📋 找到AnalysisSetup...Datum.Name行 (第{i + 1}行)")
-
-                # 检测分隔符
-                delimiter = self._detect_delimiter(line)
-                print(f"   检测到分隔符: '{delimiter}'")
-
-                parts = line.split(delimiter)
-                print(f"   分割结果: {parts}")
-
-                if len(parts) > 2:
-                    datum_name_headers = [h.strip() for h in parts[2:] if h.strip()]
-                    print(f"   AnalysisSetup列名: {datum_name_headers}")
-
-                    # 查找对应的单位行
-                    for j in range(i + 1, min(i + 10, len(lines))):
-                        unit_line = lines[j].strip()
-                        if unit_line.startswith('AnalysisSetup') and 'Datum.Unit' in unit_line:
-                            print(f"📏 找到对应的单位行 (第{j + 1}行)")
-                            unit_parts = unit_line.split(delimiter)
-
-                            if len(unit_parts) > 2:
-                                units = [u.strip() for u in unit_parts[2:] if u.strip()]
-                                print(f"   单位: {units}")
-
-                                # 创建列名->单位的映射
-                                for col, unit in zip(datum_name_headers, units):
-                                    unit_mapping[col] = unit
-                                    print(f"   {col} -> {unit}")
-                            break
-                break
-
-        # 2. 找到DataName行（这是实际的列顺序）
         data_start_line = -1
         data_headers = []
         delimiter = ','  # 默认逗号分隔
+        delim_key = file_info.ext_lower
 
-        for i, line in enumerate(lines):
-            line = line.strip()
-
-            if line.startswith('DataName'):
-                data_start_line = i
-                print(f"\n📊 找到DataName行 (第{i + 1}行)")
-                print(f"   行内容: {line}")
-
-                # 检测DataName行的分隔符
-                delimiter = self._detect_delimiter(line)
-                print(f"   DataName行分隔符: '{delimiter}'")
-
-                parts = line.split(delimiter)
-                data_headers = [h.strip() for h in parts[1:] if h.strip()]
-                self.column_order_from_dataname = data_headers.copy()
-                print(f"   DataName列顺序: {data_headers}")
-                print(f"   列数: {len(data_headers)}")
-                break
+        # 单次遍历文件头：依次处理Datum.Name、Datum.Unit和DataName行，
+        # 遇到DataName行即停止，同一个文件句柄随后直接交给pandas读取数据区
+        f = None
+        try:
+            # 以二进制方式读取，只有文件头几行需要解码，数据区由pandas直接解析字节
+            f = open(file_path, 'rb', buffering=1 << 20)
+            for i, raw_line in enumerate(f):
+                # 标记行都以'A'(AnalysisSetup)或'D'(DataName)开头，其余行不必解码和比较
+                if raw_line.lstrip()[:1] not in (b'A', b'D'):
+                    continue
+
+                line = raw_line.decode('utf-8').strip()
+
+                # 1. 找到DataName行（这是实际的列顺序）
+                if line.startswith('DataName'):
+                    data_start_line = i
+                    print(f"\n📊 找到DataName行 (第{i + 1}行)")
+                    print(f"   行内容: {line}")
+
+                    # 检测DataName行的分隔符
+                    delimiter = self._get_delimiter(line, delim_key)
+                    print(f"   DataName行分隔符: '{delimiter}'")
+
+                    parts = line.split(delimiter)
+                    data_headers = [h.strip() for h in parts[1:] if h.strip()]
+                    self.column_order_from_dataname = data_headers.copy()
+                    print(f"   DataName列顺序: {data_headers}")
+                    print(f"   列数: {len(data_headers)}")
+                    break
+
+                if not line.startswith('AnalysisSetup'):
+                    continue
+
+                # 2. AnalysisSetup...Datum.Name行提取单位映射的列名
+                if not found_datum_name and 'Datum.Name' in line:
+                    found_datum_name = True
+                    print(f"📋 找到AnalysisSetup...Datum.Name行 (第{i + 1}行)")
+
+                    # 检测分隔符
+                    unit_delimiter = self._get_delimiter(line, delim_key)
+                    print(f"   检测到分隔符: '{unit_delimiter}'")
+
+                    parts = line.split(unit_delimiter)
+                    print(f"   分割结果: {parts}")
+
+                    if len(parts) > 2:
+                        datum_name_headers = [h.strip() for h in parts[2:] if h.strip()]
+                        print(f"   AnalysisSetup列名: {datum_name_headers}")
+                        unit_search_end = i + 10
+
+                # 3. 在其后的行中查找对应的单位行
+                elif not found_datum_unit and i < unit_search_end and 'Datum.Unit' in line:
+                    found_datum_unit = True
+                    print(f"📏 找到对应的单位行 (第{i + 1}行)")
+                    unit_parts = line.split(unit_delimiter)
+
+                    if len(unit_parts) > 2:
+                        units = [u.strip() for u in unit_parts[2:] if u.strip()]
+                        print(f"   单位: {units}")
+
+                        # 创建列名->单位的映射
+                        for col, unit in zip(datum_name_headers, units):
+                            unit_mapping[col] = unit
+                            print(f"   {col} -> {unit}")
+        except Exception as e:
+            if f is not None:
+                f.close()
+            print(f"❌ 读取文件时发生错误：{e}")
+            return None, None, False
 
         if data_start_line == -1:
+            f.close()
             print("❌ 文件中未找到DataName行")
             return None, None, False
 
@@ -272,14 +364,13 @@ class OriginDataProcessor:
 
         # 4. 确定需要提取的列
         if need_columns:
-            valid_columns = []
-            missing_columns = []
+            # 列名 -> DataName中的位置（重名时取第一个）
+            header_to_idx = {}
+            for idx, col in enumerate(data_headers):
+                header_to_idx.setdefault(col, idx)
 
-            for col in need_columns:
-                if col in data_headers:
-                    valid_columns.append(col)
-                else:
-                    missing_columns.append(col)
+            valid_columns = [col for col in need_columns if col in header_to_idx]
+            missing_columns = [col for col in need_columns if col not in header_to_idx]
 
             if missing_columns:
                 print(f"⚠️  以下需要的列在文件中不存在: {missing_columns}")
@@ -288,7 +379,7 @@ class OriginDataProcessor:
 
             if valid_columns:
                 headers = valid_columns
-                col_indices = [data_headers.index(col) for col in valid_columns]
+                col_indices = [header_to_idx[col] for col in valid_columns]
                 print(f"✅ 将提取 {len(valid_columns)} 列: {valid_columns}")
                 print(f"   列索引: {col_indices}")
             else:
@@ -300,120 +391,104 @@ class OriginDataProcessor:
             col_indices = list(range(len(data_headers)))
             print(f"✅ 将提取所有 {len(headers)} 列")
 
-        # 5. 收集所有DataValue行数据
-        data_rows = []
-        skipped_rows = 0
-        data_row_count = 0
-
+        # 5. 一次性读取DataValue数据区
+        # 第0列为行标记(DataValue/SetupTitle/...)，DataName中第idx列在文件中位于idx+1
         print(f"\n📥 开始读取DataValue数据...")
+        # NeedCol只选少数列时，usecols让C解析器只转换这些列，其余字段切分后直接丢弃
+        file_cols = [idx + 1 for idx in col_indices]
 
-        for i in range(data_start_line + 1, len(lines)):
-            line = lines[i].strip()
-
-            if not line:
-                skipped_rows += 1
-                continue
-
-            if line.startswith(('SetupTitle', 'PrimitiveTest', 'TestParameter',
-                                'AnalysisSetup', 'Dimension1', 'Dimension2', '#')):
-                skipped_rows += 1
-                continue
-
-            if not line.startswith('DataValue'):
-                print(f"⚠️  第{i + 1}行不是DataValue行，跳过: {line[:50]}...")
-                skipped_rows += 1
-                continue
-
-            # 解析DataValue行
-            parts = line.split(delimiter)
-
-            if len(parts) < 2:
-                print(f"⚠️  第{i + 1}行DataValue格式错误，跳过")
-                skipped_rows += 1
-                continue
-
-            # 跳过第一个"DataValue"，获取数据
-            values = parts[1:]
-
-            # 清理数据
-            cleaned_values = []
-            for val in values:
-                cleaned_val = val.strip()
-                # 处理科学计数法中的空格
-                if ' ' in cleaned_val and ('E' in cleaned_val or 'e' in cleaned_val):
-                    cleaned_val = cleaned_val.replace(' ', '')
-                cleaned_values.append(cleaned_val)
-
-            # 检查数据行是否足够长
-            if len(cleaned_values) < len(data_headers):
-                print(f"⚠️  第{i + 1}行数据列数不足 ({len(cleaned_values)} < {len(data_headers)})")
-                # 用空值填充不足的部分
-                cleaned_values.extend([''] * (len(data_headers) - len(cleaned_values)))
-
-            # 提取指定列的数据
-            selected_values = []
-            for idx in col_indices:
-                if idx < len(cleaned_values):
-                    selected_values.append(cleaned_values[idx])
-                else:
-                    selected_values.append('')
-
-            # 检查是否有实际数据
-            has_data = any(val.strip() for val in selected_values)
-            if has_data:
-                data_rows.append(selected_values)
-                data_row_count += 1
-
-                if data_row_count <= 3:
-                    print(f"   第{i + 1}行数据示例: {selected_values}")
-            else:
-                skipped_rows += 1
+        try:
+            with f:
+                raw = pd.read_csv(
+                    f,
+                    sep=delimiter,
+                    encoding='utf-8',
+                    header=None,
+                    names=range(len(data_headers) + 1),
+                    usecols=[0] + file_cols,
+                    index_col=False,
+                    engine='c',
+                    quoting=csv.QUOTE_NONE,
+                    skipinitialspace=True,
+                    # 只有真正的空单元格才算缺失值，NA/null等文本按普通值处理
+                    keep_default_na=False,
+                    na_values=[''],
+                    # 行标记只有少数几种取值，按类别解析，后续比较只需比较整数编码
+                    dtype={0: 'category'},
+                )
+        except pd.errors.EmptyDataError:
+            print("❌ 文件中未找到有效的DataValue数据")
+            return None, None, False
+        except Exception as e:
+            print(f"❌ 读取DataValue数据时出错：{e}")
+            return None, None, False
 
-        if not data_rows:
+        # 跳过非DataValue行，只对未知的行标记给出提示
+        markers = raw[0]
+        # 前缀匹配（与逐行解析时的startswith一致），容忍'DataValue '这类带空格的标记；
+        # 行标记是类别类型，字符串操作只在少数几个类别上执行
+        is_data = markers.str.startswith('DataValue', na=False)
+        other_markers = markers[~is_data]
+        unknown_markers = other_markers[~other_markers.str.startswith(SKIP_PREFIXES, na=False)]
+        if len(unknown_markers) > 0:
+            print(f"⚠️  {len(unknown_markers)}行不是DataValue行，已跳过: {list(unknown_markers.unique()[:5])}")
+
+        # 检查是否有实际数据：行标记与空行条件合成一个掩码，只做一次行选择
+        keep = is_data & raw[file_cols].notna().any(axis=1)
+        data = raw.loc[keep, file_cols]
+        skipped_rows = len(raw) - len(data)
+
+        if data.empty:
             print("❌ 文件中未找到有效的DataValue数据")
             return None, None, False
 
         print(f"\n📈 数据读取统计:")
-        print(f"   成功读取数据行: {len(data_rows)}")
+        print(f"   成功读取数据行: {len(data)}")
         print(f"   跳过的行: {skipped_rows}")
 
         # 6. 创建DataFrame
         try:
             print(f"\n🔄 创建DataFrame...")
-            df = pd.DataFrame(data_rows, columns=headers)
+            df = data
+            df.index = pd.RangeIndex(len(df))
+            df.columns = headers
             print(f"   DataFrame创建成功，形状: {df.shape}")
 
-            # 转换数据类型
+            # 转换数据类型（纯数值列已由C解析器转换）
             print(f"🔄 转换数据类型...")
-            for col in headers:
-                try:
-                    # 尝试转换为数值类型
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-                    non_null = df[col].count()
-                    null_count = len(df) - non_null
-                    if null_count > 0:
-                        print(f"   {col}: 数值类型, {null_count}个空值")
-                    else:
-                        print(f"   {col}: 数值类型")
-                except:
-                    print(f"   {col}: 保持为字符串类型")
+            # 按位置处理各列，DataName中有重名列时也不会混淆
+            df.columns = pd.RangeIndex(df.shape[1])
+            text_cols = [pos for pos, dtype in enumerate(df.dtypes)
+                         if not pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype)]
+            if text_cols:
+                df[text_cols] = df[text_cols].apply(_text_to_numeric)
+            df.columns = headers
+
+            null_counts = df.isna().sum().to_numpy()
+            for col, null_count in zip(headers, null_counts):
+                if null_count > 0:
+                    print(f"   {col}: 数值类型, {null_count}个空值")
+                else:
+                    print(f"   {col}: 数值类型")
 
-            # 数据预览
-            print(f"\n👀 数据预览 (前3行):")
-            print(df.head(3).to_string())
+            # 数据预览（格式化宽表开销较大，仅在verbose时输出）
+            if self.verbose:
+                print(f"\n👀 数据预览 (前3行):")
+                print(df.head(3).to_string())
 
             print(f"\n📊 数据摘要:")
             print(f"   总行数: {len(df)}")
             print(f"   总列数: {len(df.columns)}")
             print(f"   列名: {list(df.columns)}")
 
-            numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
-            if len(numeric_cols) > 0:
-                print(f"   数值列统计:")
-                for col in numeric_cols:
-                    col_data = df[col].dropna()
-                    if len(col_data) > 0:
-                        print(f"     {col}: 范围=[{col_data.min():.4e}, {col_data.max():.4e}]")
+            if self.verbose:
+                numeric_pos = [pos for pos, dtype in enumerate(df.dtypes) if dtype.kind in 'if']
+                if numeric_pos:
+                    print(f"   数值列统计:")
+                    col_ranges = df.iloc[:, numeric_pos].agg(['min', 'max'])
+                    for k, pos in enumerate(numeric_pos):
+                        if null_counts[pos] < len(df):
+                            print(f"     {headers[pos]}: 范围=[{col_ranges.iat[0, k]:.4e}, {col_ranges.iat[1, k]:.4e}]")
 
             return df, headers, True
 
@@ -441,6 +516,16 @@ class OriginDataProcessor:
 
         return ','
 
+    def _get_delimiter(self, line, cache_key):
+        """优先使用同类文件上次检测到的分隔符，校验不通过时再完整检测"""
+        cached = self._delim_cache.get(cache_key)
+        if cached is not None and cached in line:
+            return cached
+
+        delimiter = self._detect_delimiter(line)
+        self._delim_cache[cache_key] = delimiter
+        return delimiter
+
     def open_or_create_project(self, project_path, project_exists):
         """打开现有工程或创建新工程"""
         try:
@@ -470,6 +555,32 @@ class OriginDataProcessor:
             traceback.print_exc()
             return False
 
+    def _apply_unit_method(self, method, col_obj, col_name, unit):
+        """用指定方式设置列单位，返回用于输出的描述"""
+        if method == 'SetUnits':
+            col_obj.SetUnits(unit)
+            return f"[单位属性: {unit}]"
+        if method == 'comments':
+            col_obj.comments = f"单位: {unit}"
+            return f"[单位: {unit}]"
+        col_obj.lname = f"{col_name} ({unit})"
+        return f"-> {col_name} ({unit})"
+
+    def _set_column_unit(self, col_obj, col_name, unit):
+        """设置列单位：先用上次成功的方式，失败时再依次尝试其余方式并记住成功的那个"""
+        methods = UNIT_METHODS
+        if self._unit_method is not None:
+            methods = (self._unit_method,) + tuple(m for m in UNIT_METHODS if m != self._unit_method)
+
+        for method in methods:
+            try:
+                desc = self._apply_unit_method(method, col_obj, col_name, unit)
+            except Exception:
+                continue
+            self._unit_method = method
+            return desc
+        return None
+
     def export_to_origin(self, df, data_filename, project_path=None, project_exists=False):
         """将DataFrame导出到Origin工作簿"""
         try:
@@ -478,13 +589,14 @@ class OriginDataProcessor:
             if not self.open_or_create_project(project_path, project_exists):
                 return False
 
-            book_name = self.get_safe_filename(os.path.basename(data_filename))
+            book_name = self.get_safe_filename(_path_info(data_filename))
             sheet_name = f"{book_name}_Sheet"
 
             print(f"📘 创建工作簿: '{book_name}'")
             print(f"   导入 {df.shape[1]} 列: {list(df.columns)}")
 
             # 创建新工作簿
+            self._exported_columns = []
             self.wb = op.new_book('w', book_name)
             self.wks = self.wb[0]
             self.wks.name = sheet_name
@@ -511,37 +623,24 @@ class OriginDataProcessor:
                 print(f"📝 添加单位信息...")
                 success_count = 0
 
-                for i, col_name in enumerate(df.columns):
-                    if col_name in self.column_units:
-                        unit = self.column_units[col_name]
+                # 先收集需要设置单位的列，再统一写入
+                unit_targets = [(i, col_name, self.column_units[col_name])
+                                for i, col_name in enumerate(df.columns)
+                                if col_name in self.column_units]
 
-                        try:
-                            # 获取列对象 - 关键修复：使用 col() 方法
-                            col_obj = self.wks._find_col(i)
-
-                            # 方法1：尝试设置单位
-                            try:
-                                #col_obj.units = unit
-                                col_obj.SetUnits(unit)
-                                print(f"   ✓ 列 {i}: {col_name} [单位属性: {unit}]")
-                                success_count += 1
-                            except:
-                                # 方法2：尝试设置注释
-                                try:
-                                    col_obj.comments = f"单位: {unit}"
-                                    print(f"   ✓ 列 {i}: {col_name} [单位: {unit}]")
-                                    success_count += 1
-                                except:
-                                    # 方法3：尝试设置长名称
-                                    try:
-                                        col_obj.lname = f"{col_name} ({unit})"
-                                        print(f"   ✓ 列 {i}: {col_name} -> {col_name} ({unit})")
-                                        success_count += 1
-                                    except:
-                                        print(f"   ⚠️ 列 {i}: {col_name} - 所有单位设置方法都失败")
-
-                        except Exception as col_error:
-                            print(f"   ❌ 列 {i}: {col_name} - 获取列对象失败: {col_error}")
+                for i, col_name, unit in unit_targets:
+                    try:
+                        col_obj = self.wks._find_col(i)
+                    except Exception as col_error:
+                        print(f"   ❌ 列 {i}: {col_name} - 获取列对象失败: {col_error}")
+                        continue
+
+                    desc = self._set_column_unit(col_obj, col_name, unit)
+                    if desc is None:
+                        print(f"   ⚠️ 列 {i}: {col_name} - 所有单位设置方法都失败")
+                    else:
+                        print(f"   ✓ 列 {i}: {col_name} {desc}")
+                        success_count += 1
 
                 print(f"   成功为 {success_count}/{len(self.column_units)} 个列添加单位信息")
             else:
@@ -564,6 +663,8 @@ class OriginDataProcessor:
                 except Exception as debug_e:
                     print(f"   获取第0列信息失败: {debug_e}")
 
+            # 记录导入的列名，绘图时无需再逐列查询工作表
+            self._exported_columns = list(df.columns)
             return True
 
         except Exception as e:
@@ -575,18 +676,20 @@ class OriginDataProcessor:
     def plot_in_origin(self, x_col, y_col, output_path, save_project=True, project_path=None):
         """在Origin中绘制图形"""
         try:
-            # 获取列索引 - 修复这里：使用 col() 而不是 cols()
-            try:
-                col_names = [self.wks.col(i).name for i in range(self.wks.cols)]
-            except AttributeError:
-                # 备选方法：如果 name 属性不可用
-                col_names = []
-                for i in range(self.wks.cols):
-                    try:
-                        col_names.append(self.wks.col(i).name)
-                    except:
-                        # 如果无法获取列名，使用默认名称
-                        col_names.append(f"Col_{i + 1}")
+            # 获取列索引 - 优先使用导出时记录的列名，避免逐列查询Origin
+            col_names = self._exported_columns
+            if not col_names:
+                try:
+                    col_names = [self.wks.col(i).name for i in range(self.wks.cols)]
+                except AttributeError:
+                    # 备选方法：如果 name 属性不可用
+                    col_names = []
+                    for i in range(self.wks.cols):
+                        try:
+                            col_names.append(self.wks.col(i).name)
+                        except:
+                            # 如果无法获取列名，使用默认名称
+                            col_names.append(f"Col_{i + 1}")
 
             print(f"📊 工作表列名: {col_names}")
 
@@ -770,7 +873,8 @@ def main():
         print(f"\n📈 步骤4: 根据配置绘制图形")
         print(f"   将生成Graph: '{graph_expected_name}'")
 
-        data_basename = os.path.splitext(os.path.basename(config['data_file']))[0]
+        data_info = _path_info(config['data_file'])
+        data_basename = data_info.stem
         output_dir = config['output_dir']
         png_output_path = os.path.join(output_dir, f"{data_basename}_plot.png")
 
@@ -801,7 +905,7 @@ def main():
             print("🎉 处理完成！")
             print(f"   数据文件: {config['data_file']}")
             print(f"   配置: X={config['X']}, Y={config['Y']}")
-            print(f"   工作簿: 基于 '{os.path.basename(config['data_file'])}' 命名")
+            print(f"   工作簿: 基于 '{data_info.basename}' 命名")
             print(f"   Graph: '{graph_expected_name}'")
             print(f"   输出图形: {png_output_path}")
 